@@ -97,9 +97,8 @@ func (filter *Filter) Pass(object string) bool {
 	if filter == nil {
 		return true
 	}
-	excluded := filter.exclude.Matches(object)
-	included := filter.include.Matches(object)
-	return !excluded && included
+	// Exclusions are checked first so excluded objects skip the include rules entirely.
+	return !filter.exclude.Matches(object) && filter.include.Matches(object)
 }
 
 // Matches will return true if any of the regular expressions in the FilterRuleSet match the pattern.
@@ -107,8 +106,9 @@ func (rules *FilterRuleSet) Matches(object string) bool {
 	if rules == nil {
 		return false
 	}
-	for _, rule := range *rules {
-		if rule.MatchString(object) {
+	// Index into the slice rather than ranging over values to avoid copying each regexp.Regexp.
+	for i := range *rules {
+		if (*rules)[i].MatchString(object) {
 			return true
 		}
 	}
@@ -219,18 +219,24 @@ func NewParser(options ...Option) *Parser {
 	return parser
 }
 
+// logArgs are the fixed arguments passed to `git log` by RepoPath.
+// It must not be modified; RepoPath copies it into a fresh slice for each invocation.
+var logArgs = []string{
+	"log",
+	"--patch", // https://git-scm.com/docs/git-log#Documentation/git-log.txt---patch
+	"--full-history",
+	"--date=format:%a %b %d %H:%M:%S %Y %z",
+	"--pretty=fuller", // https://git-scm.com/docs/git-log#_pretty_formats
+	"--notes",         // https://git-scm.com/docs/git-log#Documentation/git-log.txt---notesltrefgt
+}
+
 // RepoPath parses the output of the `git log` command for the `source` path.
 // The Diff chan will return diffs in the order they are parsed from the log.
 func (c *Parser) RepoPath(ctx context.Context, source string, head string, abbreviatedLog bool, excludedGlobs []string, isBare bool) (chan *Diff, error) {
-	args := []string{
-		"-C", source,
-		"log",
-		"--patch", // https://git-scm.com/docs/git-log#Documentation/git-log.txt---patch
-		"--full-history",
-		"--date=format:%a %b %d %H:%M:%S %Y %z",
-		"--pretty=fuller", // https://git-scm.com/docs/git-log#_pretty_formats
-		"--notes",         // https://git-scm.com/docs/git-log#Documentation/git-log.txt---notesltrefgt
-	}
+	// Size the slice up front so the optional flags and exclude globs don't trigger regrowth.
+	args := make([]string, 0, 2+len(logArgs)+2+3*len(excludedGlobs))
+	args = append(args, "-C", source)
+	args = append(args, logArgs...)
 	if abbreviatedLog {
 		args = append(args, "--diff-filter=AM")
 	}
@@ -300,10 +306,16 @@ func (c *Parser) executeCommand(ctx context.Context, cmd *exec.Cmd, isStaged boo
 	}
 
 	go func() {
-		scanner := bufio.NewScanner(stdErr)
-		for scanner.Scan() {
-			ctx.Logger().V(2).Info(scanner.Text())
+		// Only split stderr into lines when they will actually be logged, but always drain it
+		// so git never blocks writing to a full pipe.
+		logger := ctx.Logger().V(2)
+		if logger.Enabled() {
+			scanner := bufio.NewScanner(stdErr)
+			for scanner.Scan() {
+				logger.Info(scanner.Text())
+			}
 		}
+		_, _ = io.Copy(io.Discard, stdErr)
 	}()
 
 	go func() {
@@ -325,6 +337,8 @@ func (c *Parser) FromReader(ctx context.Context, stdOut io.Reader, diffChan chan
 		currentCommit *Commit
 
 		totalLogSize int
+		lineBuf      []byte
+		identities   = make(stringInterner)
 	)
 	var latestState = Initial
 
@@ -347,12 +361,38 @@ func (c *Parser) FromReader(ctx context.Context, stdOut io.Reader, diffChan chan
 			break
 		}
 
-		line, err := outReader.ReadBytes([]byte("\n")[0])
+		line, err := readLine(outReader, &lineBuf)
 		if err != nil && len(line) == 0 {
 			break
 		}
 
 		switch {
+		// Hunk content makes up the bulk of the log, so check for it before the header lines.
+		// No header check matches a hunk content line while in a hunk, so this ordering is safe.
+		case isHunkContextLine(latestState, line):
+			if latestState != HunkContentLine {
+				latestState = HunkContentLine
+			}
+			// TODO: Why do we care about this? It creates empty lines in the diff. If there are no plusLines, it's just newlines.
+			if err := currentDiff.write([]byte("\n")); err != nil {
+				ctx.Logger().Error(err, "failed to write to diff")
+			}
+		case isHunkPlusLine(latestState, line):
+			if latestState != HunkContentLine {
+				latestState = HunkContentLine
+			}
+
+			if err := currentDiff.write(line[1:]); err != nil {
+				ctx.Logger().Error(err, "failed to write to diff")
+			}
+			// NoOp. We only care about additions.
+		case isHunkMinusLine(latestState, line),
+			isHunkNewlineWarningLine(latestState, line),
+			isHunkEmptyLine(latestState, line):
+			if latestState != HunkContentLine {
+				latestState = HunkContentLine
+			}
+			// NoOp
 		case isCommitLine(isStaged, latestState, line):
 			latestState = CommitLine
 
@@ -394,7 +434,7 @@ func (c *Parser) FromReader(ctx context.Context, stdOut io.Reader, diffChan chan
 			latestState = MergeLine
 		case isAuthorLine(isStaged, latestState, line):
 			latestState = AuthorLine
-			currentCommit.Author = strings.TrimSpace(string(line[8:]))
+			currentCommit.Author = identities.intern(bytes.TrimSpace(line[8:]))
 		case isAuthorDateLine(isStaged, latestState, line):
 			latestState = AuthorDateLine
 
@@ -407,7 +447,7 @@ func (c *Parser) FromReader(ctx context.Context, stdOut io.Reader, diffChan chan
 			currentCommit.Date = date
 		case isCommitterLine(isStaged, latestState, line):
 			latestState = CommitterLine
-			currentCommit.Committer = strings.TrimSpace(string(line[8:]))
+			currentCommit.Committer = identities.intern(bytes.TrimSpace(line[8:]))
 		case isCommitterDateLine(isStaged, latestState, line):
 			latestState = CommitterDateLine
 			// NoOp
@@ -509,38 +549,9 @@ func (c *Parser) FromReader(ctx context.Context, stdOut io.Reader, diffChan chan
 			}
 			currentDiff = diff(currentCommit, withPathB(currentDiff.PathB))
 
-			words := bytes.Split(line, []byte(" "))
-			if len(words) >= 3 {
-				startSlice := bytes.Split(words[2], []byte(","))
-				lineStart, err := strconv.Atoi(string(startSlice[0]))
-				if err == nil {
-					currentDiff.LineStart = lineStart
-				}
-			}
-		case isHunkContextLine(latestState, line):
-			if latestState != HunkContentLine {
-				latestState = HunkContentLine
-			}
-			// TODO: Why do we care about this? It creates empty lines in the diff. If there are no plusLines, it's just newlines.
-			if err := currentDiff.write([]byte("\n")); err != nil {
-				ctx.Logger().Error(err, "failed to write to diff")
-			}
-		case isHunkPlusLine(latestState, line):
-			if latestState != HunkContentLine {
-				latestState = HunkContentLine
-			}
-
-			if err := currentDiff.write(line[1:]); err != nil {
-				ctx.Logger().Error(err, "failed to write to diff")
+			if lineStart, ok := lineStartFromHunkLine(line); ok {
+				currentDiff.LineStart = lineStart
 			}
-			// NoOp. We only care about additions.
-		case isHunkMinusLine(latestState, line),
-			isHunkNewlineWarningLine(latestState, line),
-			isHunkEmptyLine(latestState, line):
-			if latestState != HunkContentLine {
-				latestState = HunkContentLine
-			}
-			// NoOp
 		case isCommitSeparatorLine(latestState, line):
 			// NoOp
 		default:
@@ -575,6 +586,39 @@ func (c *Parser) FromReader(ctx context.Context, stdOut io.Reader, diffChan chan
 	ctx.Logger().V(2).Info("finished parsing git log.", "total_log_size", totalLogSize)
 }
 
+// stringInterner deduplicates strings that repeat across many commits, such as author and
+// committer identities, so that each distinct value is only allocated once per parse.
+type stringInterner map[string]string
+
+// intern returns the string for b, reusing a previously returned string when one matches.
+func (si stringInterner) intern(b []byte) string {
+	// The compiler doesn't allocate for a string(b) conversion used only as a map key.
+	if s, ok := si[string(b)]; ok {
+		return s
+	}
+	s := string(b)
+	si[s] = s
+	return s
+}
+
+// readLine returns the next line from r, including its trailing newline.
+// Unlike bufio.Reader.ReadBytes, it does not allocate a new slice for every line: the result aliases
+// r's internal buffer, or scratch for lines that don't fit in it, and is only valid until the next call.
+func readLine(r *bufio.Reader, scratch *[]byte) ([]byte, error) {
+	line, err := r.ReadSlice('\n')
+	if err != bufio.ErrBufferFull {
+		return line, err
+	}
+
+	buf := append((*scratch)[:0], line...)
+	for err == bufio.ErrBufferFull {
+		line, err = r.ReadSlice('\n')
+		buf = append(buf, line...)
+	}
+	*scratch = buf
+	return buf, err
+}
+
 func isMergeLine(isStaged bool, latestState ParseState, line []byte) bool {
 	if isStaged || latestState != CommitLine {
 		return false
@@ -748,19 +792,26 @@ func isModeLine(latestState ParseState, line []byte) bool {
 	if !(latestState == DiffLine || latestState == ModeLine) {
 		return false
 	}
-	// This could probably be better written.
-	if (len(line) > 17 && bytes.Equal(line[:17], []byte("deleted file mode"))) ||
-		(len(line) > 16 && bytes.Equal(line[:16], []byte("similarity index"))) ||
-		(len(line) > 13 && bytes.Equal(line[:13], []byte("new file mode"))) ||
-		(len(line) > 11 && bytes.Equal(line[:11], []byte("rename from"))) ||
-		(len(line) > 9 && bytes.Equal(line[:9], []byte("rename to"))) ||
-		(len(line) > 8 && bytes.Equal(line[:8], []byte("old mode"))) ||
-		(len(line) > 8 && bytes.Equal(line[:8], []byte("new mode"))) {
-		return true
+	for _, prefix := range modeLinePrefixes {
+		if len(line) > len(prefix) && bytes.HasPrefix(line, prefix) {
+			return true
+		}
 	}
 	return false
 }
 
+// modeLinePrefixes are the extended header lines that can follow a `diff --git` line.
+// See https://git-scm.com/docs/git-diff#_generating_patch_text_with_p
+var modeLinePrefixes = [][]byte{
+	[]byte("deleted file mode"),
+	[]byte("similarity index"),
+	[]byte("new file mode"),
+	[]byte("rename from"),
+	[]byte("rename to"),
+	[]byte("old mode"),
+	[]byte("new mode"),
+}
+
 // index 1ed6fbee1..aea1e643a 100644
 // index 00000000..e69de29b
 func isIndexLine(latestState ParseState, line []byte) bool {
@@ -790,30 +841,20 @@ func pathFromBinaryLine(line []byte) (string, bool) {
 		return "", true
 	}
 
-	var (
-		path string
-		err  error
-	)
 	if _, after, ok := bytes.Cut(line, []byte(" and b/")); ok {
 		// drop the " differ\n"
-		path = string(after[:len(after)-8])
-	} else if _, after, ok = bytes.Cut(line, []byte(` and "b/`)); ok {
+		return string(after[:len(after)-8]), true
+	}
+	if before, _, ok := bytes.Cut(line, []byte(` and "b/`)); ok {
 		// Edge case where the path is quoted.
 		// https://github.com/trufflesecurity/trufflehog/issues/2384
 
-		// Drop the `" differ\n` and handle escaped characters in the path.
-		// e.g., "\342\200\224" instead of "—".
-		// See https://github.com/trufflesecurity/trufflehog/issues/2418
-		path, err = strconv.Unquote(`"` + string(after[:len(after)-9]) + `"`)
-		if err != nil {
-			return "", false
-		}
-	} else {
-		// Unknown format.
-		return "", false
+		// Skip the " and ", drop the " differ\n", and unquote what remains.
+		return unquotePath(bytes.TrimSuffix(line[len(before)+5:], []byte(" differ\n")), "b/")
 	}
 
-	return path, true
+	// Unknown format.
+	return "", false
 }
 
 // --- a/internal/addrs/move_endpoint_module.go
@@ -850,29 +891,29 @@ func pathFromToFileLine(line []byte) (string, bool) {
 		return "", true
 	}
 
-	var (
-		path string
-		err  error
-	)
 	if _, after, ok := bytes.Cut(line, []byte("+++ b/")); ok {
-		path = string(after)
-	} else if _, after, ok = bytes.Cut(line, []byte(`+++ "b/`)); ok {
+		return string(after), true
+	}
+	if quoted, ok := bytes.CutPrefix(line, []byte("+++ ")); ok && bytes.HasPrefix(quoted, []byte(`"b/`)) {
 		// Edge case where the path is quoted.
 		// e.g., `+++ "b/C++/1 \320\243\321\200\320\276\320\272/B.c"`
+		return unquotePath(quoted, "b/")
+	}
 
-		// Drop the trailing `"` and handle escaped characters in the path
-		// e.g., "\342\200\224" instead of "—".
-		// See https://github.com/trufflesecurity/trufflehog/issues/2418
-		path, err = strconv.Unquote(`"` + string(after[:len(after)-1]) + `"`)
-		if err != nil {
-			return "", false
-		}
-	} else {
-		// Unknown format.
+	// Unknown format.
+	return "", false
+}
+
+// unquotePath decodes a path that git has C-quoted, e.g. `"b/\342\200\224.txt"`, and strips
+// the given diff prefix from the result. The quoted literal is handed to strconv.Unquote
+// as-is, rather than being trimmed and re-wrapped in quotes first.
+// See https://github.com/trufflesecurity/trufflehog/issues/2418
+func unquotePath(quoted []byte, prefix string) (string, bool) {
+	path, err := strconv.Unquote(string(quoted))
+	if err != nil || !strings.HasPrefix(path, prefix) {
 		return "", false
 	}
-
-	return path, true
+	return path[len(prefix):], true
 }
 
 // @@ -298 +298 @@ func maxRetryErrorHandler(resp *http.Response, err error, numTries int)
@@ -886,6 +927,30 @@ func isHunkLineNumberLine(latestState ParseState, line []byte) bool {
 	return false
 }
 
+// Get the starting line number in the new file, e.g. 298 for `@@ -298,2 +298,3 @@`.
+// The fields are located by offset rather than by splitting the whole line, which can carry
+// an arbitrarily long function context after the closing `@@`.
+func lineStartFromHunkLine(line []byte) (int, bool) {
+	// Skip the leading "@@" and the old file's range.
+	_, rest, ok := bytes.Cut(line, []byte(" "))
+	if !ok {
+		return 0, false
+	}
+	if _, rest, ok = bytes.Cut(rest, []byte(" ")); !ok {
+		return 0, false
+	}
+
+	// The new file's range is either "+start" or "+start,count".
+	if i := bytes.IndexAny(rest, " ,"); i >= 0 {
+		rest = rest[:i]
+	}
+	lineStart, err := strconv.Atoi(string(rest))
+	if err != nil {
+		return 0, false
+	}
+	return lineStart, true
+}
+
 // fmt.Println("ok")
 // (There's a space before `fmt` that gets removed by the formatter.)
 func isHunkContextLine(latestState ParseState, line []byte) bool {
@@ -1,7 +1,9 @@
 package gitparse
 
 import (
+	"bufio"
 	"bytes"
+	"io"
 	"strings"
 	"testing"
 	"time"
@@ -728,6 +730,7 @@ func TestToFileLinePathParse(t *testing.T) {
 		"+++ /dev/null\n":      "",
 		"+++ b/embeds.xml\t\n": "embeds.xml",
 		"+++ \"b/C++/1 \\320\\243\\321\\200\\320\\276\\320\\272/B.c\"\t\n": "C++/1 Урок/B.c",
+		"+++ \"b/quote\\\"d.txt\"\n":                                       "quote\"d.txt",
 	}
 
 	for name, expected := range cases {
@@ -741,6 +744,28 @@ func TestToFileLinePathParse(t *testing.T) {
 	}
 }
 
+func TestHunkLineStartParse(t *testing.T) {
+	cases := map[string]int{
+		"@@ -298 +298 @@ func maxRetryErrorHandler(resp *http.Response, err error, numTries int)\n": 298,
+		"@@ -1,2 +3,4 @@\n": 3,
+		"@@ -0,0 +1 @@\n":   1,
+	}
+
+	for name, expected := range cases {
+		lineStart, ok := lineStartFromHunkLine([]byte(name))
+		if !ok {
+			t.Errorf("Failed to get line start: %s", name)
+		}
+		if lineStart != expected {
+			t.Errorf("Expected: %d, Got: %d", expected, lineStart)
+		}
+	}
+
+	if _, ok := lineStartFromHunkLine([]byte("@@ -1,2 @@\n")); ok {
+		t.Errorf("Expected failure for malformed hunk line")
+	}
+}
+
 // Equal compares the content of two Commits to determine if they are the same.
 func (d1 *Diff) Equal(ctx context.Context, d2 *Diff) bool {
 	// isEqualString handles the error-prone String() method calls and compares the results.
@@ -1436,6 +1461,44 @@ index 0000000..5af88a8
 +The door of all subtleties!
 `
 
+func TestReadLine(t *testing.T) {
+	long := strings.Repeat("a", 100)
+	input := "short\n" + long + "\n\nno newline"
+	// Use a reader smaller than the long line to exercise the scratch buffer path.
+	reader := bufio.NewReaderSize(strings.NewReader(input), 16)
+
+	var scratch []byte
+	for _, expected := range []string{"short\n", long + "\n", "\n", "no newline"} {
+		line, err := readLine(reader, &scratch)
+		if err != nil && err != io.EOF {
+			t.Fatalf("unexpected error: %v", err)
+		}
+		if string(line) != expected {
+			t.Errorf("Expected: %q, Got: %q", expected, line)
+		}
+	}
+
+	if line, err := readLine(reader, &scratch); err != io.EOF || len(line) != 0 {
+		t.Errorf("Expected empty line and EOF, Got: %q, %v", line, err)
+	}
+}
+
+func TestStringInterner(t *testing.T) {
+	identities := make(stringInterner)
+	first := identities.intern([]byte("Bill Rich <bill.rich@trufflesec.com>"))
+	second := identities.intern([]byte("Bill Rich <bill.rich@trufflesec.com>"))
+	if first != second {
+		t.Errorf("Expected: %q, Got: %q", first, second)
+	}
+
+	if other := identities.intern([]byte("Dustin Decker <dustin@trufflesec.com>")); other == first {
+		t.Errorf("Expected a distinct string, Got: %q", other)
+	}
+	if len(identities) != 2 {
+		t.Errorf("Expected: 2 interned strings, Got: %d", len(identities))
+	}
+}
+
 func TestMaxDiffSize(t *testing.T) {
 	parser := NewParser()
 	builder := strings.Builder{}
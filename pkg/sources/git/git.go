@@ -578,6 +578,7 @@ func (s *Git) ScanCommits(ctx context.Context, repo *git.Repository, path string
 		gitDir         = getGitDir(path, scanOptions)
 		depth          int64
 		lastCommitHash string
+		when           string
 	)
 
 	for diff := range diffChan {
@@ -594,11 +595,12 @@ func (s *Git) ScanCommits(ctx context.Context, repo *git.Repository, path string
 		}
 
 		email := commit.Author
-		when := commit.Date.UTC().Format("2006-01-02 15:04:05 -0700")
 
 		if fullHash != lastCommitHash {
 			depth++
 			lastCommitHash = fullHash
+			// A commit yields one diff per file, so only format its date once.
+			when = commit.Date.UTC().Format("2006-01-02 15:04:05 -0700")
 			atomic.AddUint64(&s.metrics.commitsScanned, 1)
 			logger.V(5).Info("scanning commit", "commit", fullHash)
 
@@ -606,20 +608,23 @@ func (s *Git) ScanCommits(ctx context.Context, repo *git.Repository, path string
 			// See https://github.com/trufflesecurity/trufflehog/issues/2683
 			var (
 				metadata = s.sourceMetadataFunc("", email, fullHash, when, remoteURL, 0)
-				sb       strings.Builder
+				message  = commit.Message.String()
+				// Build the chunk data directly rather than via a strings.Builder, which would
+				// need a second full copy to convert its result to a []byte.
+				data = make([]byte, 0, len(email)+len(commit.Committer)+len(message)+2)
 			)
-			sb.WriteString(email)
-			sb.WriteString("\n")
-			sb.WriteString(commit.Committer)
-			sb.WriteString("\n")
-			sb.WriteString(commit.Message.String())
+			data = append(data, email...)
+			data = append(data, '\n')
+			data = append(data, commit.Committer...)
+			data = append(data, '\n')
+			data = append(data, message...)
 			chunk := sources.Chunk{
 				SourceName:     s.sourceName,
 				SourceID:       s.sourceID,
 				JobID:          s.jobID,
 				SourceType:     s.sourceType,
 				SourceMetadata: metadata,
-				Data:           []byte(sb.String()),
+				Data:           data,
 				Verify:         s.verify,
 			}
 			if err := reporter.ChunkOk(ctx, chunk); err != nil {
@@ -721,10 +726,11 @@ func (s *Git) gitChunk(ctx context.Context, diff *gitparse.Diff, fileName, email
 	newChunkBuffer := bytes.Buffer{}
 	lastOffset := 0
 	for offset := 0; originalChunk.Scan(); offset++ {
-		line := make([]byte, len(originalChunk.Bytes())+1)
-		copy(line, originalChunk.Bytes())
-		line[len(line)-1] = byte('\n')
-		if len(line) > sources.ChunkSize || len(line)+newChunkBuffer.Len() > sources.ChunkSize {
+		// The scanner strips the trailing newline and reuses its buffer between calls,
+		// so lines are only copied when they are written out.
+		line := originalChunk.Bytes()
+		lineLen := len(line) + 1
+		if lineLen > sources.ChunkSize || lineLen+newChunkBuffer.Len() > sources.ChunkSize {
 			// Add oversize chunk info
 			if newChunkBuffer.Len() > 0 {
 				// Send the existing fragment.
@@ -746,7 +752,7 @@ func (s *Git) gitChunk(ctx context.Context, diff *gitparse.Diff, fileName, email
 				newChunkBuffer.Reset()
 				lastOffset = offset
 			}
-			if len(line) > sources.ChunkSize {
+			if lineLen > sources.ChunkSize {
 				// Send the oversize line.
 				metadata := s.sourceMetadataFunc(fileName, email, hash, when, urlMetadata, int64(diff.LineStart+offset))
 				chunk := sources.Chunk{
@@ -755,7 +761,7 @@ func (s *Git) gitChunk(ctx context.Context, diff *gitparse.Diff, fileName, email
 					JobID:          s.jobID,
 					SourceType:     s.sourceType,
 					SourceMetadata: metadata,
-					Data:           line,
+					Data:           append(append(make([]byte, 0, lineLen), line...), '\n'),
 					Verify:         s.verify,
 				}
 				if err := reporter.ChunkOk(ctx, chunk); err != nil {
@@ -769,6 +775,7 @@ func (s *Git) gitChunk(ctx context.Context, diff *gitparse.Diff, fileName, email
 		if _, err := newChunkBuffer.Write(line); err != nil {
 			ctx.Logger().Error(err, "error writing to chunk buffer", "filename", fileName, "commit", hash, "file", diff.PathB)
 		}
+		newChunkBuffer.WriteByte('\n')
 	}
 	// Send anything still in the new chunk buffer
 	if newChunkBuffer.Len() > 0 {
@@ -894,7 +901,7 @@ func (s *Git) ScanStaged(ctx context.Context, repo *git.Repository, path string,
 			defer reader.Close()
 
 			data := make([]byte, d.Len())
-			if _, err := reader.Read(data); err != nil {
+			if _, err := io.ReadFull(reader, data); err != nil {
 				ctx.Logger().Error(
 					err, "error reading diff content for staged",
 					"filename", fileName,